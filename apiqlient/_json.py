@@ -0,0 +1,47 @@
+"""
+JSON backend selection for ApiQlient
+
+Picks the fastest available decoder once at import time (orjson > msgspec > simdjson > ujson > stdlib json)
+and normalizes it to loads(data: bytes | str) -> object and dumps(obj) -> str.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve() -> tuple:
+    """Resolve the best available backend, normalizing signatures"""
+    # pylint:disable=import-outside-toplevel
+    try:
+        import orjson
+
+        return "orjson", orjson.loads, lambda obj: orjson.dumps(obj).decode()
+    except ImportError:
+        pass
+    try:
+        import msgspec.json
+
+        return "msgspec", msgspec.json.decode, lambda obj: msgspec.json.encode(obj).decode()
+    except ImportError:
+        pass
+    try:
+        import simdjson
+
+        return "simdjson", simdjson.loads, json.dumps  # simdjson only accelerates decoding
+    except ImportError:
+        pass
+    try:
+        import ujson
+
+        return "ujson", ujson.loads, ujson.dumps
+    except ImportError:
+        pass
+    return "json", json.loads, json.dumps
+
+
+backend, loads, dumps = _resolve()
+logger.debug(f"Using JSON backend: {backend}")
@@ -4,16 +4,19 @@ ApiQlient is a simple HTTP/HTTPS client
 
 from __future__ import annotations
 
+import re
+import sys
+import asyncio
 import functools
 import dataclasses
-from typing import Coroutine
+from typing import Callable, Coroutine
 
 # pylint:disable=ungrouped-imports
 from yarl import URL
 from aiohttp import ClientSession, ClientResponse
 from urllib3 import HTTPResponse, HTTPConnectionPool, HTTPSConnectionPool
 from aiohttp.client import _RequestContextManager
-from starlette.routing import Match
+from starlette.routing import Match, Route
 from starlette.applications import Starlette
 
 try:
@@ -23,32 +26,83 @@ except ImportError:
 
 try:
     import dataclass_wizard
+
+    # dataclass_wizard 1.0 renamed JSONSerializable to JSONWizard
+    _JSONSerializable = getattr(dataclass_wizard, "JSONSerializable", None) or dataclass_wizard.JSONWizard
 except ImportError:
     dataclass_wizard = None
+    _JSONSerializable = None
 
 try:
     import pydantic
 except ImportError:
     pydantic = None
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 
+from ._json import loads as _loads  # Fastest available backend, parses raw bytes directly
 from .router import ClientRouter
 
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
+# Interned uppercase forms of the legal HTTP methods, computed once at import
+_METHODS_UPPER = {
+    method: sys.intern(method.upper())
+    for method in ("get", "head", "post", "put", "delete", "connect", "options", "trace", "patch")
+}
+
+
+def _not_in_context(*_, **__):
+    """Placeholder bound to the HTTP methods outside of a client context"""
+    raise NotImplementedError("Client not in context")
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_ctor(cls: type) -> Callable[[dict], object]:
+    """
+    Resolve the dict -> object constructor for a route endpoint once per class
+    """
+    build = cls.__dict__.get("__apiqlient_build__")  # Own builder only; a parent's closes over the parent class
+    if build is not None:
+        ctor = build
+    elif dataclass_wizard and issubclass(cls, _JSONSerializable):
+        ctor = cls.from_dict
+    elif pydantic and issubclass(cls, pydantic.BaseModel):
+        ctor = cls.parse_obj
+    else:
+
+        def ctor(data: dict):
+            return cls(**data)
+
+    cls.__apiqlient_ctor__ = ctor  # Attribute cache so later hits skip even the lru_cache lookup
+    return ctor
+
+
+_PARSERS_AVAILABLE = bool(dataclass_wizard or pydantic)
+
 
 class BaseRequest:  # pylint:disable=too-few-public-methods
     """
     Base request class
     """
 
-    _response: ClientResponse | HTTPResponse = None
+    __slots__ = ("cls", "_client", "_method", "_method_upper", "_url", "_kwargs", "_response", "method")
+
+    _response: ClientResponse | HTTPResponse
 
     def __init__(self, dataclass, client: ApiQlient, method: str, url, **kwargs):
         self.cls = dataclass
         self._client = client
         self._method = method
+        self._method_upper = _METHODS_UPPER.get(method) or method.upper()
 
         self._url = url
         self._kwargs = kwargs
+        self._response = None
 
 
 class BaseResponse:  # pylint:disable=too-few-public-methods
@@ -63,18 +117,20 @@ class BaseResponse:  # pylint:disable=too-few-public-methods
     ):
         """Parse response object from dict"""
         try:
-            if cls and any([dataclass_wizard, pydantic]):
-                if dataclass_wizard and issubclass(cls, dataclass_wizard.JSONSerializable):
-                    return cls.from_dict(data)
-                if pydantic and issubclass(cls, pydantic.BaseModel):
-                    return cls.parse_obj(data)
-                return cls(**data)
-            if munch:
-                return munch.munchify(data)
+            return self._from_dict_fast(data, cls)
         except Exception as exc:
             if none_error:
                 return None
             raise type(exc)(f"Error trying to retrieve {self.url}: [{exc}]") from exc
+
+    def _from_dict_fast(self, /, data: dict, cls: dataclasses.dataclass | pydantic.BaseModel | None):
+        """Parse response object from dict, no error wrapping: just ctor(data)"""
+        if cls and _PARSERS_AVAILABLE:
+            # Read from cls.__dict__ so a subclass doesn't inherit its parent's cached ctor
+            ctor = cls.__dict__.get("__apiqlient_ctor__") or _resolve_ctor(cls)
+            return ctor(data)
+        if munch:
+            return munch.munchify(data)
         raise ValueError("munch is not installed")
 
 
@@ -88,11 +144,14 @@ class Request(BaseRequest):
         Response class for synchronous HTTP(S) requests
         """
 
-        def _object(self, cls: type = None, *, none_error: bool = False):
+        def _object(self, *, none_error: bool = False):
             """
-            Helper function to pass internal class argument through functools.partial
+            Helper function parsing the body with the dataclass bound by the request
+
+            The raw bytes are fed to the JSON decoder directly, skipping the str decode
+            that urllib3's json() would perform.
             """
-            return self._from_dict(cls=cls, data=self.json(), none_error=none_error)
+            return self._from_dict(cls=getattr(self, "_cls", None), data=_loads(self.data), none_error=none_error)
 
         def object(self, *, none_error: bool = False) -> dataclasses.dataclass | munch.Munch | pydantic.BaseModel:
             """
@@ -103,7 +162,9 @@ class Request(BaseRequest):
             """
             return self._object(none_error=none_error)
 
-    _response: HTTPResponse = None
+    __slots__ = ()
+
+    _response: HTTPResponse
 
     def __init__(self, dataclass, client: ApiQlient, method: str, url, **kwargs):
         super().__init__(dataclass, client, method, url, **kwargs)
@@ -117,17 +178,16 @@ class Request(BaseRequest):
         Return response object
         """
         with self:
-            assert isinstance(self._response, Request.Response)
             return self._response
 
     def __enter__(self):
         if self._response is None:
-            assert isinstance(self._client.client, (HTTPConnectionPool, HTTPSConnectionPool))
-            self._response = self.method(self._client.client, self._method.upper(), self._url, **self._kwargs)
+            self._response = self.method(self._client.client, self._method_upper, self._url, **self._kwargs)
             self._response.__class__ = Request.Response
 
             # Bind dataclass to object parsing
-            self._response._object = functools.partial(self._response._object, cls=self.cls)
+            self._response._cls = self.cls
+            self._kwargs = None  # Dispatched; drop the reference so payloads don't outlive the call
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -144,11 +204,16 @@ class AsyncRequest(BaseRequest):
         Response class for asynchronous HTTP(S) requests
         """
 
-        async def _object(self, cls: type = None, none_error: bool = False):
+        async def _object(self, *, none_error: bool = False):
             """
-            Helper function to pass internal class argument through functools.partial
+            Helper function parsing the body with the dataclass bound by the request
+
+            The raw bytes are fed to the JSON decoder directly, skipping the str decode
+            that aiohttp's json() would perform.
             """
-            return self._from_dict(cls=cls, data=await self.json(content_type=None), none_error=none_error)
+            return self._from_dict(
+                cls=getattr(self, "_cls", None), data=_loads(await self.read()), none_error=none_error
+            )
 
         async def object(self, *, none_error: bool = False) -> dataclasses.dataclass | munch.Munch | pydantic.BaseModel:
             """
@@ -159,32 +224,36 @@ class AsyncRequest(BaseRequest):
             """
             return await self._object(none_error=none_error)
 
-    _request: _RequestContextManager = None
-    _response: ClientResponse = None
+    __slots__ = ("_request",)
+
+    _request: _RequestContextManager
+    _response: ClientResponse
 
     def __init__(self, dataclass, client: ApiQlient, method: str, url, **kwargs):
         super().__init__(dataclass, client, method, url, **kwargs)
 
         self.method = getattr(ClientSession, self._method.lower())
-
-        assert isinstance(self._client.client, ClientSession)
-        self._request = self.method(self._client.client, self._url, **self._kwargs)
+        self._request = None
 
     async def response(self) -> AsyncRequest.Response:
         """
         Return response object
         """
         async with self:
-            assert isinstance(self._response, AsyncRequest.Response)
             return self._response
 
     async def __aenter__(self):
         if self._response is None:
+            if self._request is None:  # Built on demand so unused requests don't allocate a context manager
+                self._request = self.method(self._client.client, self._url, **self._kwargs)
             self._response = await self._request
-            self._response.__class__ = AsyncRequest.Response
+            if not isinstance(self._response, AsyncRequest.Response):  # Session may use a custom response_class
+                self._response.__class__ = AsyncRequest.Response
 
             # Bind dataclass to object parsing
-            self._response._object = functools.partial(self._response._object, cls=self.cls)
+            self._response._cls = self.cls
+            self._request = None  # Dispatched; drop the manager and payload references
+            self._kwargs = None
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -198,6 +267,7 @@ class ApiQlient(Starlette):  # pylint:disable=too-many-instance-attributes
 
     client: ClientSession | HTTPConnectionPool
     methods = ("get", "head", "post", "put", "delete", "connect", "options", "trace", "patch")
+    _methods_upper = _METHODS_UPPER
 
     async_scope: bool | None = None
 
@@ -221,18 +291,87 @@ class ApiQlient(Starlette):  # pylint:disable=too-many-instance-attributes
         self._args = args
         self._kwargs = kwargs
         self._paths = {}
+        self._pool: HTTPConnectionPool | None = None
+        self._pool_kwargs = {"maxsize": kwargs.pop("maxsize", 32), "block": False}
+        self._static_routes: dict[tuple[str, str], Route] | None = None
+        self._static_paths: dict[str, Route] = {}
+        self._dynamic_routes: list[Route] = []
+        self._combined_re: re.Pattern | None = None
+        self._routes_by_group: dict[str, list[Route]] = {}
 
         self.router: ClientRouter = ClientRouter()
 
     def include_router(self, router: ClientRouter, *, prefix=""):
         """Include router in client"""
         self.router.include_router(router, prefix=prefix)
+        self._static_routes = None  # Invalidate precomputed lookup tables
+
+    async def gather(self, calls: list[AsyncRequest], *, none_error: bool = False) -> list:
+        """
+        Dispatch async requests concurrently and parse all responses in one pass
+
+        :keyword none_error: If True, return None for responses that fail json() -> object parsing
+        """
+        responses = await asyncio.gather(*(call.response() for call in calls))
+        return await asyncio.gather(*(response.object(none_error=none_error) for response in responses))
+
+    def _build_route_maps(self):
+        """
+        Split routes into an O(1) static path lookup and the parameterized remainder
+        """
+        static: dict[tuple[str, str], Route] = {}
+        paths: dict[str, Route] = {}
+        dynamic: list[Route] = []
+        for route in self.routes:
+            if "{" not in route.path:
+                for method in route.methods or ():
+                    static.setdefault((route.path, method), route)
+                paths.setdefault(route.path, route)  # Partial-match fallback: path known, method not
+            else:
+                dynamic.append(route)
+        self._static_routes = static
+        self._static_paths = paths
+        self._dynamic_routes = dynamic
+        self._compile_dynamic_routes(dynamic)
+
+    def _compile_dynamic_routes(self, dynamic: list[Route]):
+        """
+        Join the parameterized routes' regexes into one alternation matched in a single pass
+
+        Compiled with google-re2 when installed (DFA matching, no backtracking), stdlib re otherwise.
+        """
+        parts: list[str] = []
+        by_group: dict[str, list[Route]] = {}
+        groups: dict[str, str] = {}
+        for route in dynamic:
+            # Starlette patterns look like ^/todos/(?P<id>[^/]+)$; anonymize the inner
+            # groups so identical params across routes don't collide in the alternation
+            source = _NAMED_GROUP.sub("(?:", route.path_regex.pattern).removeprefix("^").removesuffix("$")
+            group = groups.get(source)
+            if group is None:
+                group = f"r{len(parts)}"
+                groups[source] = group
+                by_group[group] = []
+                parts.append(f"(?P<{group}>{source})")
+            by_group[group].append(route)
+        if parts:
+            pattern = "|".join(parts)
+            engine = re2 or re
+            try:
+                self._combined_re = engine.compile(pattern)
+            except Exception:  # pylint:disable=broad-except # Pattern unsupported by re2
+                self._combined_re = re.compile(pattern)
+        else:
+            self._combined_re = None
+        self._routes_by_group = by_group
 
     # Use aiohttp for async requests
     async def __aenter__(self):
         self._make_context(async_scope=True)
         args = (f"{self.scheme}://{self.host}:{self.port}", *self._args)
-        self.client = await ClientSession(*args, **self._kwargs).__aenter__()
+        # Responses are born as AsyncRequest.Response, avoiding a per-request __class__ swap
+        kwargs = {"response_class": AsyncRequest.Response, **self._kwargs}
+        self.client = await ClientSession(*args, **kwargs).__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -242,36 +381,38 @@ class ApiQlient(Starlette):  # pylint:disable=too-many-instance-attributes
 
     def __enter__(self):
         self._make_context(async_scope=False)
-        if self.scheme == "http":
-            self.client = HTTPConnectionPool(self.host, self.port, *self._args, **self._kwargs)
-        elif self.scheme == "https":
-            self.client = HTTPSConnectionPool(self.host, self.port, *self._args, **self._kwargs)
+        if self._pool is None:
+            kwargs = self._pool_kwargs | self._kwargs
+            if self.scheme == "http":
+                self._pool = HTTPConnectionPool(self.host, self.port, *self._args, **kwargs)
+            elif self.scheme == "https":
+                self._pool = HTTPSConnectionPool(self.host, self.port, *self._args, **kwargs)
+        self.client = self._pool
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        assert isinstance(self.client, HTTPConnectionPool)
-        self.client.close()
+        # Keep the pool open across `with` blocks so keep-alive connections are reused
         self._remove_context()
 
+    def close(self):
+        """
+        Close the cached sync connection pool
+
+        The pool is kept open when a `with` block exits so that keep-alive connections
+        survive across contexts; call this once the client will no longer be used.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
     def _make_context(self, async_scope: bool):
         """
         Make context for client
         """
-
-        def generate_method(method):
-            """
-            Generate method for client
-            """
-
-            def func(method: str, path: str, **kwargs):
-                return self._route(path, method, **kwargs)
-
-            return functools.partial(func, method)
-
         self.async_scope = async_scope
 
         for method in self.methods:
-            setattr(self, method, generate_method(method))
+            setattr(self, method, getattr(self, f"_{method}"))
 
     def _remove_context(self):
         """
@@ -280,7 +421,7 @@ class ApiQlient(Starlette):  # pylint:disable=too-many-instance-attributes
         self.async_scope = None
 
         for method in self.methods:
-            setattr(self, method, lambda *_, **__: (_ for _ in ()).throw(NotImplementedError("Client not in context")))
+            setattr(self, method, _not_in_context)
 
     def _route(self, path, method, **kwargs):
         """
@@ -288,46 +429,76 @@ class ApiQlient(Starlette):  # pylint:disable=too-many-instance-attributes
         """
 
         def _path():
-            scope = {"type": "http", "path": path, "method": method.upper()}
-            routes = {Match.FULL: [], Match.PARTIAL: []}
-            for route in self.routes:
+            # Local scope dict: the fallback is rare and a shared one isn't thread-safe
+            scope = {"type": "http", "path": path, "method": method_upper}
+            partial = None
+            for route in self._dynamic_routes:
                 match, _ = route.matches(scope=scope)
-                if match != Match.NONE:
-                    routes[match].append(route)
-            if routes[Match.FULL]:
-                return routes[Match.FULL][0]
-            if routes[Match.PARTIAL]:
-                return routes[Match.PARTIAL][0]
-            return None
-
-        _route = _path()
+                if match == Match.FULL:
+                    return route
+                if match == Match.PARTIAL and partial is None:
+                    partial = route
+            return partial
+
+        def _dynamic():
+            if self._combined_re is None:
+                return None
+            match = self._combined_re.fullmatch(path)
+            if match is None:
+                return None
+            candidates = self._routes_by_group[match.lastgroup]
+            for route in candidates:
+                if method_upper in (route.methods or ()):
+                    return route
+            # Earliest pattern matched but not the method; other patterns may still match fully
+            return _path()
+
+        method_upper = self._methods_upper.get(method) or method.upper()
+        if self._static_routes is None:
+            self._build_route_maps()
+        # Full matches first (static then dynamic), then the static partial fallback:
+        # a known path requested under a different method still binds its endpoint
+        _route = self._static_routes.get((path, method_upper)) or _dynamic() or self._static_paths.get(path)
         cls = Request if not self.async_scope else AsyncRequest
         return cls(dataclass=_route.endpoint if _route else None, client=self, method=method, url=path, **kwargs)
 
-    # Define "get", "head", "post", "put", "delete", "connect", "options", "trace", "patch" methods for hints
-    def get(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
-        raise NotImplementedError("When defining paths use `@client.router.get(...)` instead")
+    # Per-method bound callers installed by _make_context, one frame cheaper than a closure + partial chain
+    def _get(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
+        return self._route(path, "get", **kwargs)
+
+    def _head(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
+        return self._route(path, "head", **kwargs)
+
+    def _post(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
+        return self._route(path, "post", **kwargs)
 
-    def head(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
-        raise NotImplementedError("When defining paths use `@client.router.head(...)` instead")
+    def _put(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
+        return self._route(path, "put", **kwargs)
 
-    def post(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
-        raise NotImplementedError("When defining paths use `@client.router.post(...)` instead")
+    def _delete(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
+        return self._route(path, "delete", **kwargs)
 
-    def put(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
-        raise NotImplementedError("When defining paths use `@client.router.put(...)` instead")
+    def _connect(
+        self, path, **kwargs
+    ) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
+        return self._route(path, "connect", **kwargs)
 
-    def delete(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
-        raise NotImplementedError("When defining paths use `@client.router.delete(...)` instead")
+    def _options(
+        self, path, **kwargs
+    ) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
+        return self._route(path, "options", **kwargs)
 
-    def connect(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
-        raise NotImplementedError("When defining paths use `@client.router.connect(...)` instead")
+    def _trace(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
+        return self._route(path, "trace", **kwargs)
 
-    def options(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
-        raise NotImplementedError("When defining paths use `@client.router.options(...)` instead")
+    def _patch(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
+        return self._route(path, "patch", **kwargs)
 
-    def trace(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
-        raise NotImplementedError("When defining paths use `@client.router.trace(...)` instead")
+    # Define "get", "head", "post", "put", "delete", "connect", "options", "trace", "patch" methods for hints,
+    # all sharing a single stub function object
+    def _router_stub(
+        self, path, **kwargs
+    ) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
+        raise NotImplementedError("When defining paths use `@client.router.<method>(...)` instead")
 
-    def patch(self, path, **kwargs) -> Request | Coroutine[AsyncRequest]:  # pylint:disable=missing-function-docstring
-        raise NotImplementedError("When defining paths use `@client.router.patch(...)` instead")
+    get = head = post = put = delete = connect = options = trace = patch = _router_stub
@@ -5,16 +5,44 @@ ApiQlient client router
 from __future__ import annotations
 
 import warnings
+import dataclasses
 from typing import Callable
 
 from starlette.routing import Route, Router
 
 
+def _compile_build(endpoint: type) -> Callable[[dict], object] | None:
+    """
+    Compile a straight-line dict -> dataclass builder for a plain dataclass endpoint
+
+    Returns None when the endpoint needs per-call logic the generated code cannot express
+    (non-init fields, default factories) or handles its own parsing (e.g. dataclass_wizard).
+    """
+    if not dataclasses.is_dataclass(endpoint) or hasattr(endpoint, "from_dict"):
+        return None
+    args = []
+    namespace = {"_cls": endpoint}
+    for i, field in enumerate(dataclasses.fields(endpoint)):
+        if not field.init or field.default_factory is not dataclasses.MISSING:
+            return None
+        key = field.metadata.get("alias", field.name) if field.metadata else field.name
+        if field.default is not dataclasses.MISSING:
+            namespace[f"_d{i}"] = field.default
+            args.append(f"{field.name}=d.get({key!r}, _d{i})")
+        else:
+            args.append(f"{field.name}=d[{key!r}]")
+    source = f"def _build(d):\n    return _cls({', '.join(args)})\n"
+    exec(source, namespace)  # pylint:disable=exec-used
+    return namespace["_build"]
+
+
 class ClientRoute(Route):
     """
     Custom route for client application
     """
 
+    __slots__ = ("list_of",)
+
     def __init__(self, path, endpoint, *, methods, list_of: bool = False, **kwargs):
         super().__init__(path, endpoint, methods=methods, **kwargs)
         self.list_of = list_of
@@ -64,6 +92,10 @@ class ClientRouter(Router):
         """
         Add a new client route to the router
         """
+        if isinstance(endpoint, type) and "__apiqlient_build__" not in endpoint.__dict__:
+            build = _compile_build(endpoint)
+            if build is not None:
+                endpoint.__apiqlient_build__ = build
         route = ClientRoute(
             path=self.prefix + path,
             endpoint=endpoint,
@@ -3,7 +3,12 @@ import asyncio
 from dataclasses import dataclass
 
 from pydantic import Field, BaseModel
-from dataclass_wizard import JSONSerializable, json_field
+
+try:
+    from dataclass_wizard import JSONSerializable, json_field
+except ImportError:  # dataclass_wizard 1.0 renamed JSONSerializable to JSONWizard and json_field to Alias
+    from dataclass_wizard import Alias as json_field
+    from dataclass_wizard import JSONWizard as JSONSerializable
 
 from apiqlient import ApiQlient, ClientRouter
 
@@ -38,22 +43,16 @@ async def main():
     start = time.time()
     print("ASYNC")
     async with client:
-        rqs = [client.get(todo) for todo in todos]
-        responses = await asyncio.gather(*[request.response() for request in rqs])
-        objects = []
-        for response in responses:
-            objects.append(await response.object())
+        # One gather dispatches all requests and parses every body in a single batch
+        objects = await client.gather([client.get(todo) for todo in todos])
     print(f"Finished parsing {len(objects)} requests in {time.time()-start} seconds")
     print(f"Example response: {objects[0]}.")
 
     start = time.time()
     print("SYNC")
     with client:
-        rqs = [client.get(todo) for todo in todos]
-        responses = [request.response() for request in rqs]
-        objects = []
-        for response in responses:
-            objects.append(response.object())
+        responses = [client.get(todo).response() for todo in todos]
+        objects = [response.object() for response in responses]
     print(f"Finished parsing {len(objects)} requests in {time.time()-start} seconds")
     print(f"Example response: {objects[0]}.")
 
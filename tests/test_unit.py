@@ -10,3 +10,41 @@ def test():
     import apiqlient  # pylint:disable=import-outside-toplevel,unused-import
 
     assert True
+
+
+def test_request_releases_kwargs():
+    """
+    Dispatched requests must not keep their kwargs (payloads, headers) alive
+    """
+    # pylint:disable=import-outside-toplevel
+    import json
+    import threading
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+
+    from apiqlient import ApiQlient
+
+    class Handler(BaseHTTPRequestHandler):
+        """Serve a static JSON body"""
+
+        def do_GET(self):  # pylint:disable=invalid-name,missing-function-docstring
+            body = json.dumps({"id": 1}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = ApiQlient(base_url=f"http://127.0.0.1:{server.server_port}")
+        with client:
+            request = client.get("/todos/1", headers={"Accept": "application/json"})
+            response = request.response()
+            assert request._kwargs is None  # pylint:disable=protected-access
+            assert response.object() == {"id": 1}
+        client.close()
+    finally:
+        server.shutdown()